@@ -0,0 +1,102 @@
+"""Examples for GOPH 419 (Computational Methods for Geophysicists).
+
+Notes
+-----
+The example modules are loaded lazily,
+the first time that one of their names is accessed.
+For example, after
+
+    import source
+    s = source.binary_string_float64(0.2)
+
+only topic01_number_representation has been imported.
+This matters because some of the modules use numpy,
+which is slow to import,
+and the number representation and series approximation examples
+are written in pure Python and do not need it.
+Importing a submodule directly, for example
+
+    from source.topic02_linalg_module import gauss_solve
+
+works as usual.
+
+The example scripts use relative imports,
+so they should be run as modules from the directory above this one:
+
+    python -m source.topic02_gauss_elim_examples
+"""
+
+
+import importlib
+
+
+# the public functions of each submodule, keyed by submodule name
+_SUBMODULE_EXPORTS = {
+        "topic01_number_representation": [
+                "parse_sign",
+                "max_power_int",
+                "normalize_float",
+                "digit_list",
+                "digits_to_str_int",
+                "decimal_string_int",
+                "binary_string_int",
+                "binary_string_float64",
+                ],
+        "topic01_series_approximation": [
+                "exp",
+                ],
+        "topic01_error_analysis": [
+                "parse_sign_array",
+                "normalize_float_array",
+                "ulp_distance",
+                "relative_error",
+                "exponent_spread",
+                "error_summary",
+                "combine_summaries",
+                "stream_error_summary",
+                "evaluate_chunks",
+                "print_summary",
+                ],
+        "topic02_linalg_module": [
+                "gauss_solve",
+                ],
+        }
+
+# look up table from exported name to the submodule that defines it
+_EXPORTS = {name: module
+            for module, names in _SUBMODULE_EXPORTS.items()
+            for name in names}
+
+__all__ = list(_SUBMODULE_EXPORTS) + list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Import submodules and their functions on first access.
+
+    Parameters
+    ----------
+    name : str
+        The name of a submodule or an exported function.
+
+    Returns
+    -------
+    module or callable
+        The requested submodule or function.
+
+    Raises
+    ------
+    AttributeError
+        If name is not a submodule or exported function
+    """
+    if name in _SUBMODULE_EXPORTS:
+        return importlib.import_module(f".{name}", __name__)
+    if (module := _EXPORTS.get(name)) is not None:
+        value = getattr(importlib.import_module(f".{module}", __name__), name)
+        # cache the value so __getattr__ is not called again for this name
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,123 @@
+"""Startup time benchmarks for importing the example modules.
+
+Notes
+-----
+Each statement is timed in a fresh Python process,
+since a module is only really imported once per process.
+The time includes starting the interpreter itself,
+so the "python" baseline (an empty statement) is also reported
+for comparison.
+
+Run this module as a script from the directory above this one:
+
+    python -m source.benchmark_startup
+"""
+
+
+import os
+import subprocess
+import sys
+import time
+
+
+# the name of this package, used to build import statements
+_PACKAGE = __spec__.parent
+
+# the directory that contains this package, used as each process's cwd
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def startup_cases():
+    """Get the statements to time.
+
+    Returns
+    -------
+    dict
+        Python statements, keyed by a short description.
+    """
+    return {
+            "python": "pass",
+            "numpy": "import numpy",
+            "package": f"import {_PACKAGE}",
+            "format number": (f"import {_PACKAGE}; "
+                              + f"{_PACKAGE}.binary_string_float64(0.2)"),
+            "series exp": (f"from {_PACKAGE}.topic01_series_approximation "
+                           + "import exp; exp(1.)"),
+            "linalg": (f"from {_PACKAGE}.topic02_linalg_module "
+                       + "import gauss_solve"),
+            }
+
+
+def _run(statement):
+    """Run a statement in a new Python process.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to run.
+
+    Returns
+    -------
+    str
+        The output of the process.
+
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If the statement fails
+    """
+    return subprocess.run([sys.executable, "-c", statement],
+                          cwd=_ROOT, check=True,
+                          capture_output=True, text=True).stdout
+
+
+def startup_time(statement, repeat=5):
+    """Measure the time to run a statement in a new Python process.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to run.
+    repeat : int, optional, default=5
+        The number of times to run the statement.
+
+    Returns
+    -------
+    float
+        The minimum run time, in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        _run(statement)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def imports_numpy(statement):
+    """Check whether running a statement imports numpy.
+
+    Parameters
+    ----------
+    statement : str
+        The Python statement to run.
+
+    Returns
+    -------
+    bool
+        True if numpy has been imported after running the statement.
+    """
+    check = "; import sys; print('numpy' in sys.modules)"
+    return _run(statement + check).strip() == "True"
+
+
+def main():
+    print("\nStartup time of new Python processes:\n")
+    for name, statement in startup_cases().items():
+        t = startup_time(statement)
+        numpy_str = "numpy" if imports_numpy(statement) else ""
+        print(f"{name:>16} : {1e3 * t:8.1f} ms  {numpy_str}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+"""Input generation and throughput benchmarks for the topic 01 examples.
+
+Notes
+-----
+The input generators here are used by the tests for
+topic01_series_approximation and topic01_number_representation
+to check accuracy and round-trip correctness over many values,
+including edge cases that are easy to miss
+when checking only a few hand-picked points.
+The same inputs are used to measure the throughput (calls per second)
+of each function, so that changes to these functions can be checked
+for both correctness and speed.
+
+Run this module as a script from the directory above this one
+to print the throughput of each function:
+
+    python -m source.benchmark_topic_01 [results.json [baseline.json]]
+
+An optional file name can be passed to also save the results as JSON.
+If a second file name is passed, the results are compared to
+the baseline results saved in that file by an earlier run.
+The ratio of new to old throughput is printed for each function,
+and the script exits with status 1 if any ratio is below MIN_SPEED_RATIO.
+"""
+
+
+import json
+import sys
+import time
+
+import numpy as np
+
+from .topic01_number_representation import (
+        binary_string_float64,
+        binary_string_int,
+        decimal_string_int,
+        )
+from .topic01_series_approximation import (
+        exp,
+        )
+
+
+# the smallest ratio of new to baseline throughput
+# that is not reported as a slowdown
+MIN_SPEED_RATIO = 0.8
+
+# arguments of exp() that are likely to cause trouble
+EXP_EDGE_CASES = [
+        0., -0., 5e-324, -5e-324, 2.2250738585072014e-308, 1e-10, -1e-10,
+        1., -1., 2., -2., 5., -5., 20., -20., 100., -100.,
+        700., -700., 708., -708., 709., 709.78,
+        -720., -745.,
+        ]
+
+# floats that are likely to cause trouble when formatting
+FLOAT_EDGE_CASES = [
+        0., -0., 5e-324, -5e-324, 2.2250738585072014e-308, 1e-300,
+        0.1, 0.2, 0.5, 1., -1., 1.567, 12.867, 173., -173.,
+        2.**52, 2.**53 - 1., 1e300, -1e300, 1.7976931348623157e+308,
+        ]
+
+# integers that are likely to cause trouble when formatting
+INT_EDGE_CASES = [
+        0, 1, -1, 2, 9, -31, 173, -173, 255, 256,
+        2**31 - 1, -2**31, 2**53 + 1, 2**63, -2**63, 10**30,
+        ]
+
+
+def exp_inputs(n, x_max=708., seed=0):
+    """Generate arguments for testing exp().
+
+    Parameters
+    ----------
+    n : int
+        The number of random values.
+    x_max : float, optional, default=708.
+        The maximum absolute value of the random values.
+        The default of 708. keeps exp(x) within the normal float range.
+    seed : int, optional, default=0
+        The seed for the random number generator.
+
+    Returns
+    -------
+    list of float
+        The edge cases with abs(x) <= x_max,
+        followed by n random values uniformly distributed in
+        [-x_max, x_max].
+    """
+    rng = np.random.default_rng(seed)
+    edge = [x for x in EXP_EDGE_CASES if abs(x) <= x_max]
+    return edge + [float(x) for x in rng.uniform(-x_max, x_max, n)]
+
+
+def exp_subnormal_inputs(n, seed=0):
+    """Generate arguments for testing exp() with subnormal results.
+
+    Parameters
+    ----------
+    n : int
+        The number of random values.
+    seed : int, optional, default=0
+        The seed for the random number generator.
+
+    Returns
+    -------
+    list of float
+        The edge cases with exp(x) in the subnormal range,
+        followed by n random values uniformly distributed in
+        [-745., -709.8].
+    """
+    rng = np.random.default_rng(seed)
+    edge = [x for x in EXP_EDGE_CASES if -745. <= x <= -709.8]
+    return edge + [float(x) for x in rng.uniform(-745., -709.8, n)]
+
+
+def float_inputs(n, seed=0):
+    """Generate finite floats for testing number formatting.
+
+    Parameters
+    ----------
+    n : int
+        The number of random values.
+    seed : int, optional, default=0
+        The seed for the random number generator.
+
+    Returns
+    -------
+    list of float
+        The edge cases, followed by n random values
+        with random signs, significands, and exponents,
+        including subnormal values.
+    """
+    rng = np.random.default_rng(seed)
+    sign = rng.choice([-1., 1.], n)
+    significand = rng.uniform(0.5, 1., n)
+    e = rng.integers(-1073, 1024, n, endpoint=True)
+    x = sign * np.ldexp(significand, e)
+    return FLOAT_EDGE_CASES + [float(xk) for xk in x]
+
+
+def int_inputs(n, seed=0):
+    """Generate integers for testing number formatting.
+
+    Parameters
+    ----------
+    n : int
+        The number of random values.
+    seed : int, optional, default=0
+        The seed for the random number generator.
+
+    Returns
+    -------
+    list of int
+        The edge cases, followed by n random values
+        with magnitudes spread over many orders of magnitude.
+    """
+    rng = np.random.default_rng(seed)
+    n_digits = rng.integers(1, 62, n, endpoint=True)
+    sign = rng.choice([-1, 1], n)
+    return INT_EDGE_CASES + [int(s) * int(rng.integers(0, 2**int(d)))
+                             for s, d in zip(sign, n_digits)]
+
+
+def calls_per_second(func, args, min_time=0.2):
+    """Measure the throughput of a function of a single argument.
+
+    Parameters
+    ----------
+    func : callable
+        The function to measure.
+    args : list
+        The arguments to call func with, one at a time.
+    min_time : float, optional, default=0.2
+        The minimum time to spend, in seconds.
+        The whole list of args is repeated until this is exceeded.
+
+    Returns
+    -------
+    float
+        The number of calls per second.
+    """
+    n_calls = 0
+    t0 = time.perf_counter()
+    while (elapsed := time.perf_counter() - t0) < min_time:
+        for x in args:
+            func(x)
+        n_calls += len(args)
+    return n_calls / elapsed
+
+
+def run_benchmarks(n=1000, min_time=0.2):
+    """Measure the throughput of each of the topic 01 functions.
+
+    Parameters
+    ----------
+    n : int, optional, default=1000
+        The number of random inputs for each function.
+    min_time : float, optional, default=0.2
+        The minimum time to spend on each function, in seconds.
+
+    Returns
+    -------
+    dict
+        The calls per second, keyed by function name.
+    """
+    floats = float_inputs(n)
+    ints = int_inputs(n)
+    cases = [
+            (exp, exp_inputs(n)),
+            (decimal_string_int, ints),
+            (binary_string_int, ints),
+            (binary_string_float64, floats),
+            ]
+    return {func.__name__: calls_per_second(func, args, min_time=min_time)
+            for func, args in cases}
+
+
+def compare_results(results, baseline):
+    """Compare benchmark results to baseline results.
+
+    Parameters
+    ----------
+    results : dict
+        The calls per second, keyed by function name,
+        as returned by run_benchmarks().
+    baseline : dict
+        The baseline calls per second, in the same format.
+
+    Returns
+    -------
+    dict
+        The ratio of new to baseline calls per second,
+        for each function in both results and baseline.
+        A ratio < 1 means the function is slower than the baseline.
+    """
+    return {name: rate / baseline[name]
+            for name, rate in results.items()
+            if name in baseline}
+
+
+def main():
+    results = run_benchmarks()
+    print("\nThroughput of topic 01 functions:\n")
+    for name, rate in results.items():
+        print(f"{name:>24} : {rate:12.1f} calls/s")
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w") as f:
+            json.dump(results, f, indent=4)
+    if len(sys.argv) > 2:
+        with open(sys.argv[2]) as f:
+            baseline = json.load(f)
+        ratios = compare_results(results, baseline)
+        print(f"\nThroughput compared to {sys.argv[2]}:\n")
+        for name, ratio in ratios.items():
+            flag = "SLOWER" if ratio < MIN_SPEED_RATIO else ""
+            print(f"{name:>24} : {ratio:12.2f} x  {flag}")
+        if any(ratio < MIN_SPEED_RATIO for ratio in ratios.values()):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Tests for lazy loading of the package and startup time benchmarks."""
+
+import importlib
+
+from .benchmark_startup import (
+        imports_numpy,
+        startup_cases,
+        startup_time,
+        )
+
+
+def test_lazy_exports():
+    """Tests for lazy loading of package attributes."""
+    package = importlib.import_module(__package__)
+    module = package.topic01_number_representation
+    assert package.binary_string_float64 is module.binary_string_float64
+    assert "exp" in dir(package)
+    try:
+        package.not_an_example
+    except AttributeError:
+        pass
+    else:
+        assert False, "expected AttributeError"
+
+
+def test_all_exports():
+    """Tests that every name in the package export table can be loaded."""
+    package = importlib.import_module(__package__)
+    for module_name, names in package._SUBMODULE_EXPORTS.items():
+        module = getattr(package, module_name)
+        for name in names:
+            assert getattr(package, name) is getattr(module, name)
+    assert set(package.__all__) <= set(dir(package))
+
+
+def test_no_numpy_import():
+    """Tests that the pure Python examples do not import numpy."""
+    cases = startup_cases()
+    assert not imports_numpy(cases["package"])
+    assert not imports_numpy(cases["format number"])
+    assert not imports_numpy(cases["series exp"])
+    assert imports_numpy(cases["linalg"])
+
+
+def test_startup_time():
+    """Tests for benchmark_startup.startup_time()."""
+    assert startup_time(startup_cases()["python"], repeat=1) > 0.
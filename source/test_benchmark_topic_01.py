@@ -0,0 +1,47 @@
+"""Tests for topic 01 input generation and throughput benchmarks."""
+
+import math
+
+from .benchmark_topic_01 import (
+        calls_per_second,
+        compare_results,
+        exp_inputs,
+        exp_subnormal_inputs,
+        float_inputs,
+        int_inputs,
+        run_benchmarks,
+        )
+
+
+def test_inputs():
+    """Tests for the topic 01 input generators."""
+    assert all(abs(x) <= 1. for x in exp_inputs(100, x_max=1.))
+    assert all(-745. <= x <= -709.8 for x in exp_subnormal_inputs(100))
+    assert all(math.isfinite(x) for x in float_inputs(100))
+    assert all(isinstance(x, int) for x in int_inputs(100))
+    # the same seed gives the same values
+    assert float_inputs(100, seed=1) == float_inputs(100, seed=1)
+
+
+def test_calls_per_second():
+    """Tests for benchmark_topic_01.calls_per_second()."""
+    calls = []
+    rate = calls_per_second(calls.append, [1, 2, 3], min_time=0.01)
+    assert len(calls) % 3 == 0
+    assert rate > 0.
+
+
+def test_run_benchmarks():
+    """Tests for benchmark_topic_01.run_benchmarks()."""
+    results = run_benchmarks(n=10, min_time=0.01)
+    assert set(results) == {"exp", "decimal_string_int",
+                            "binary_string_int", "binary_string_float64"}
+    for rate in results.values():
+        assert rate > 0.
+
+
+def test_compare_results():
+    """Tests for benchmark_topic_01.compare_results()."""
+    ratios = compare_results({"exp": 50., "new": 1.},
+                             {"exp": 100., "old": 1.})
+    assert ratios == {"exp": 0.5}
@@ -0,0 +1,122 @@
+"""Tests for floating point error analysis example."""
+
+import numpy as np
+
+from .topic01_number_representation import (
+        normalize_float,
+        parse_sign,
+        )
+from .topic01_error_analysis import (
+        combine_summaries,
+        error_summary,
+        evaluate_chunks,
+        exponent_spread,
+        normalize_float_array,
+        parse_sign_array,
+        relative_error,
+        stream_error_summary,
+        ulp_distance,
+        )
+
+
+def test_parse_sign_array():
+    """Tests for topic01_error_analysis.parse_sign_array()."""
+    x = [3., -2.5, 0., -1e-300]
+    sign, value = parse_sign_array(x)
+    for xk, sk, vk in zip(x, sign, value):
+        assert (sk, vk) == parse_sign(xk)
+
+
+def test_normalize_float_array():
+    """Tests for topic01_error_analysis.normalize_float_array()."""
+    x = [1., 0.5, 173., 12.867, 0.2, 1e-300, 1e300]
+    significand, e = normalize_float_array(x)
+    for xk, sk, ek in zip(x, significand, e):
+        assert (sk, ek) == normalize_float(xk)
+
+
+def test_ulp_distance():
+    """Tests for topic01_error_analysis.ulp_distance()."""
+    x = np.array([1., -1., 1e-300, 1e300, 0.])
+    assert np.all(ulp_distance(x, x) == 0)
+    assert np.all(ulp_distance(np.nextafter(x, np.inf), x) == 1)
+    assert np.all(ulp_distance(x, np.nextafter(x, -np.inf)) == 1)
+    # the smallest subnormals on either side of zero are 2 ulp apart
+    assert ulp_distance(-5e-324, 5e-324) == 2
+    assert ulp_distance(-0., 0.) == 0
+    # the largest distance does not overflow
+    big = np.finfo(float).max
+    assert ulp_distance(-big, big) == 2 * (2**63 - 2**52 - 1)
+
+
+def test_relative_error():
+    """Tests for topic01_error_analysis.relative_error()."""
+    rel_err = relative_error([1.1, 0., 0.5], [1., 0., 0.])
+    assert np.allclose(rel_err, [0.1, 0., np.inf])
+
+
+def test_exponent_spread():
+    """Tests for topic01_error_analysis.exponent_spread()."""
+    assert exponent_spread([0.25, -8., 0., np.inf, np.nan]) == (-1, 4)
+    assert exponent_spread([0., np.nan]) == (None, None)
+
+
+def test_stream_error_summary():
+    """Tests for topic01_error_analysis.stream_error_summary()."""
+    x = np.linspace(-3., 3., 1001)
+    ref = np.exp(x)
+    approx = ref * (1. + 1e-12 * np.sin(x))
+    approx[::100] = ref[::100]
+    whole = error_summary(approx, ref)
+    chunks = ((approx[k:k + 64], ref[k:k + 64])
+              for k in range(0, x.size, 64))
+    streamed = stream_error_summary(chunks)
+    for key in whole:
+        assert np.all(whole[key] == streamed[key])
+    assert whole["count"] == x.size
+    assert whole["exact"] >= 11
+    assert np.sum(whole["hist"]) == whole["count"] - whole["exact"]
+
+
+def test_error_summary_nonfinite():
+    """Tests for non-finite values in topic01_error_analysis.error_summary()."""
+    summary = error_summary([1., np.inf, np.nan], [1., np.inf, 2.])
+    assert summary["count"] == 1
+    assert summary["nonfinite"] == 2
+    assert summary["exact"] == 1
+
+
+def test_error_summary_zero_ref():
+    """Tests for zero reference values
+    in topic01_error_analysis.error_summary().
+    """
+    summary = error_summary([5e-324, 0.], [0., 0.])
+    assert summary["count"] == 2
+    assert summary["exact"] == 1
+    assert summary["max_rel_error"] == np.inf
+    # the non-zero approximation of zero is counted in the worst bin
+    assert summary["hist"][-1] == 1
+    assert np.sum(summary["hist"]) == 1
+
+
+def test_combine_summaries_bin_edges():
+    """Tests for mismatched bin edges
+    in topic01_error_analysis.combine_summaries().
+    """
+    s1 = error_summary([1.], [1.])
+    s2 = error_summary([1.], [1.], bin_edges=[-16., 0.])
+    try:
+        combine_summaries(s1, s2)
+    except ValueError:
+        pass
+    else:
+        assert False, "expected ValueError"
+
+
+def test_evaluate_chunks():
+    """Tests for topic01_error_analysis.evaluate_chunks()."""
+    x = range(10)
+    chunks = list(evaluate_chunks(float, np.asarray, x, chunk_size=4))
+    assert [c[0].size for c in chunks] == [4, 4, 2]
+    for approx, ref in chunks:
+        assert np.all(approx == ref)
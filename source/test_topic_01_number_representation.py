@@ -0,0 +1,96 @@
+"""Tests for number representation example."""
+
+import math
+
+from .benchmark_topic_01 import (
+        float_inputs,
+        int_inputs,
+        )
+from .topic01_number_representation import (
+        binary_string_float64,
+        binary_string_int,
+        decimal_string_int,
+        )
+
+
+def _parse_digits(digits, base):
+    """Convert a string of digits back to an integer.
+
+    Raises
+    ------
+    ValueError
+        If digits is empty
+        If any digit is >= base
+    """
+    if not digits:
+        raise ValueError("no digits to parse")
+    result = 0
+    for d in digits:
+        if (d := int(d)) >= base:
+            raise ValueError(f"digit {d} is not valid in base {base}")
+        result = result * base + d
+    return result
+
+
+def _parse_string_int(s, base):
+    """Convert a string from decimal_string_int()
+    or binary_string_int() back to an integer.
+    """
+    sign, digits = s.split(" ")
+    value = _parse_digits(digits, base)
+    return -value if sign == "1" else value
+
+
+def _parse_string_float64(s):
+    """Convert a string from binary_string_float64() back to a float."""
+    sign, e_sign, e_digits, significand = s.split(" ")
+    e = _parse_digits(e_digits, 2)
+    if e_sign == "1":
+        e = -e
+    # significand digits have place values 2**-1 to 2**-53
+    # use ldexp() so that 2**(e - 53) does not underflow for subnormals
+    value = math.ldexp(_parse_digits(significand, 2), e - len(significand))
+    return -value if sign == "1" else value
+
+
+def test_decimal_string_int():
+    """Round-trip tests for topic01_number_representation.decimal_string_int().
+    """
+    for x in int_inputs(1000):
+        assert _parse_string_int(decimal_string_int(x), 10) == x
+    assert decimal_string_int(0) == "0 0"
+
+
+def test_binary_string_int():
+    """Round-trip tests for topic01_number_representation.binary_string_int().
+    """
+    for x in int_inputs(1000):
+        s = binary_string_int(x)
+        assert set(s) <= set("01 ")
+        assert _parse_string_int(s, 2) == x
+    assert binary_string_int(0) == "0 0"
+
+
+def test_binary_string_float64():
+    """Round-trip tests
+    for topic01_number_representation.binary_string_float64().
+    """
+    for x in float_inputs(1000):
+        s = binary_string_float64(x)
+        assert set(s) <= set("01 ")
+        assert (y := _parse_string_float64(s)) == x
+        # check the sign separately, since -0.0 == 0.0
+        assert math.copysign(1., y) == math.copysign(1., x)
+
+
+def test_binary_string_float64_nonfinite():
+    """Tests for topic01_number_representation.binary_string_float64()
+    with non-finite input.
+    """
+    for x in [math.inf, -math.inf, math.nan]:
+        try:
+            binary_string_float64(x)
+        except ValueError:
+            pass
+        else:
+            assert False, f"expected ValueError for x = {x}"
@@ -2,34 +2,68 @@
 
 import numpy as np
 
-from topic01_series_approximation import (
+from .benchmark_topic_01 import (
+        exp_inputs,
+        exp_subnormal_inputs,
+        )
+from .topic01_error_analysis import (
+        ulp_distance,
+        )
+from .topic01_series_approximation import (
         exp,
         )
 
 
+def _max_ulp_error(x):
+    """Get the maximum ulp error of exp() compared to numpy.exp()."""
+    x = np.array(x)
+    return int(np.max(ulp_distance([exp(xk) for xk in x], np.exp(x))))
+
+
 def test_exp():
     """Tests for topic_01_series_approximation.exp()."""
     tol = 1e-8
+    for x in [0., 5., -5.]:
+        assert abs(np.exp(x) - exp(x)) < tol
+    assert abs(np.e - exp(1)) < tol
+
+
+def test_exp_ulp_small():
+    """Tests for topic_01_series_approximation.exp()
+    with small random and edge case input.
+    """
+    assert _max_ulp_error(exp_inputs(2000, x_max=1.)) <= 16
+
+
+def test_exp_ulp_medium():
+    """Tests for topic_01_series_approximation.exp()
+    with medium random and edge case input.
+    """
+    assert _max_ulp_error(exp_inputs(2000, x_max=20.)) <= 32
+
+
+def test_exp_ulp_large():
+    """Tests for topic_01_series_approximation.exp()
+    with large random and edge case input.
+    """
+    assert _max_ulp_error(exp_inputs(2000)) <= 128
+
+
+def test_exp_ulp_subnormal():
+    """Tests for topic_01_series_approximation.exp()
+    with input that gives subnormal results.
+    """
+    x = exp_subnormal_inputs(2000)
+    assert -720. in x and -745. in x
+    assert _max_ulp_error(x) <= 128
+
 
-    x = 0.
-    if abs(np.exp(x) - exp(x)) < tol:
-        print(f"Success for x = {x}.")
-    else:
-        print(f"Failed, expected : {np.exp(x)}, actual : {exp(x)}")
-
-    x = 5.
-    if abs(np.exp(x) - exp(x)) < tol:
-        print(f"Success for x = {x}.")
-    else:
-        print(f"Failed, expected : {np.exp(x)}, actual : {exp(x)}")
-
-    x = -5.
-    if abs(np.exp(x) - exp(x)) < tol:
-        print(f"Success for x = {x}.")
-    else:
-        print(f"Failed, expected : {np.exp(x)}, actual : {exp(x)}")
-
-    print(f"e = {exp(1)}")
+def test_exp_overflow():
+    """Tests for topic_01_series_approximation.exp()
+    with input that overflows or underflows.
+    """
+    assert exp(1000.) == np.inf
+    assert exp(-1000.) == 0.
 
 
 if __name__ == '__main__':
@@ -0,0 +1,424 @@
+"""Examples of floating point error analysis over arrays of values.
+
+Notes
+-----
+The functions in this module are vectorized versions of the ideas
+in topic01_number_representation.
+Where parse_sign() and normalize_float() take apart a single number,
+the functions here use numpy to do the same for a whole array at once,
+and then measure how far a set of approximations is from a set of
+reference values:
+
+- in units in the last place (ulp),
+  which counts the number of representable float64 values between them
+- by the spread of the binary exponents of the values
+- by a histogram of the relative errors
+
+A summary of these measures can be computed for one pair of arrays
+with error_summary(), or accumulated over a stream of chunks
+with stream_error_summary(), so that large result sets never need
+to be held in memory all at once.
+"""
+
+
+import numpy as np
+
+
+# default histogram bin edges, in powers of 10 of the relative error
+# fixed edges make histograms from different chunks directly addable
+REL_ERROR_BIN_EDGES = np.arange(-18, 3, dtype=float)
+
+
+def parse_sign_array(x):
+    """Separate the signs and values of an array of numbers.
+
+    Parameters
+    ----------
+    x : array_like
+        The values to parse.
+
+    Returns
+    -------
+    numpy.ndarray, dtype=int
+        The signs of the numbers.
+        0 for +ve, 1 for -ve.
+    numpy.ndarray, dtype=float
+        The absolute values of the numbers.
+
+    Notes
+    -----
+    Unlike parse_sign(), the sign of -0.0 is reported as 1,
+    since it is taken from the sign bit.
+    """
+    x = np.asarray(x, dtype=float)
+    return np.signbit(x).astype(int), np.abs(x)
+
+
+def normalize_float_array(x):
+    """Get the normalized significands and exponents
+    for an array of floating point values such that the significands
+    are >= 1/2 and < 1.
+
+    Parameters
+    ----------
+    x : array_like
+        The values to normalize.
+
+    Returns
+    -------
+    numpy.ndarray, dtype=float
+        The normalized significands.
+    numpy.ndarray, dtype=int
+        The exponents after normalization.
+
+    Notes
+    -----
+    This is the binary (base=2) case of normalize_float()
+    applied to the absolute values of x,
+    computed with numpy.frexp() instead of a loop.
+    Zero values give a significand of 0.0 and an exponent of 0.
+    """
+    x = np.abs(np.asarray(x, dtype=float))
+    significand, e = np.frexp(x)
+    return significand, e.astype(int)
+
+
+def _ordered_bits(x):
+    """Map float64 values to int64 values with the same ordering.
+
+    Parameters
+    ----------
+    x : numpy.ndarray, dtype=float
+        The values to map.
+
+    Returns
+    -------
+    numpy.ndarray, dtype=int64
+        Integers such that adjacent float64 values
+        map to adjacent integers.
+
+    Notes
+    -----
+    Does not explicitly check for NaN values.
+    Both +0.0 and -0.0 map to 0.
+    """
+    bits = np.ascontiguousarray(x, dtype=np.float64).view(np.int64)
+    # the sign bit makes negative floats negative ints,
+    # but the remaining bits still increase with magnitude,
+    # so flip them to make the order match the float order
+    return np.where(bits < 0, -(bits & np.int64(0x7FFFFFFFFFFFFFFF)), bits)
+
+
+def ulp_distance(approx, ref):
+    """Calculate the distance between floating point values
+    in units in the last place (ulp).
+
+    Parameters
+    ----------
+    approx : array_like
+        The approximate values.
+    ref : array_like
+        The reference values, broadcastable with approx.
+
+    Returns
+    -------
+    numpy.ndarray, dtype=uint64
+        The number of float64 steps between each pair of values.
+        A value of 0 means the approximation is exact.
+
+    Notes
+    -----
+    The result is not meaningful where either input is NaN.
+    """
+    a, b = np.broadcast_arrays(_ordered_bits(np.asarray(approx, dtype=float)),
+                               _ordered_bits(np.asarray(ref, dtype=float)))
+    # subtract as unsigned ints so that distances across zero
+    # that do not fit in int64 are still correct
+    return (np.maximum(a, b).astype(np.uint64)
+            - np.minimum(a, b).astype(np.uint64))
+
+
+def relative_error(approx, ref):
+    """Calculate the relative error of approximate values.
+
+    Parameters
+    ----------
+    approx : array_like
+        The approximate values.
+    ref : array_like
+        The reference values, broadcastable with approx.
+
+    Returns
+    -------
+    numpy.ndarray, dtype=float
+        The relative errors abs((approx - ref) / ref).
+
+    Notes
+    -----
+    Where ref == 0 the relative error is inf if approx != 0,
+    and 0 if approx == 0, without dividing by zero.
+    """
+    approx = np.asarray(approx, dtype=float)
+    ref = np.asarray(ref, dtype=float)
+    abs_err = np.abs(approx - ref)
+    abs_ref = np.abs(ref)
+    return np.divide(abs_err, abs_ref,
+                     out=np.where(abs_err > 0, np.inf, 0.),
+                     where=(abs_ref != 0))
+
+
+def exponent_spread(x):
+    """Get the range of binary exponents in an array of values.
+
+    Parameters
+    ----------
+    x : array_like
+        The values to check.
+
+    Returns
+    -------
+    int or None
+        The minimum exponent of the non-zero finite values.
+    int or None
+        The maximum exponent of the non-zero finite values.
+
+    Notes
+    -----
+    Exponents are as returned by normalize_float_array().
+    If there are no non-zero finite values, returns (None, None).
+    """
+    x = np.asarray(x, dtype=float)
+    x = x[np.isfinite(x) & (x != 0)]
+    if not x.size:
+        return None, None
+    e = normalize_float_array(x)[1]
+    return int(np.min(e)), int(np.max(e))
+
+
+def _combine_min(a, b):
+    """Get the minimum of two values, either of which may be None."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return min(a, b)
+
+
+def _combine_max(a, b):
+    """Get the maximum of two values, either of which may be None."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return max(a, b)
+
+
+def error_summary(approx, ref, bin_edges=REL_ERROR_BIN_EDGES):
+    """Summarize the error in an array of approximate values.
+
+    Parameters
+    ----------
+    approx : array_like
+        The approximate values.
+    ref : array_like
+        The reference values, broadcastable with approx.
+    bin_edges : array_like, optional, default=REL_ERROR_BIN_EDGES
+        The histogram bin edges, in powers of 10 of the relative error.
+
+    Returns
+    -------
+    dict
+        The summary, with the following keys:
+        "count" : int, the number of finite pairs of values
+        "nonfinite" : int, the number of pairs with a NaN or inf value
+        "exact" : int, the number of pairs with zero error
+        "max_ulp" : int, the largest ulp distance
+        "sum_ulp" : int, the sum of ulp distances, for computing the mean
+        "max_rel_error" : float, the largest relative error
+        "approx_exponents" : tuple, exponent_spread() of approx
+        "ref_exponents" : tuple, exponent_spread() of ref
+        "bin_edges" : numpy.ndarray, the histogram bin edges
+        "hist" : numpy.ndarray, counts of non-zero relative errors
+        with log10 values in each bin,
+        values outside the bins are counted in the first or last bin
+
+    Notes
+    -----
+    Only pairs where both values are finite are included in the
+    error measures.
+    Summaries with the same bin_edges can be merged with
+    combine_summaries().
+    """
+    approx, ref = np.broadcast_arrays(np.asarray(approx, dtype=float),
+                                      np.asarray(ref, dtype=float))
+    bin_edges = np.asarray(bin_edges, dtype=float)
+    finite = np.isfinite(approx) & np.isfinite(ref)
+    approx = approx[finite]
+    ref = ref[finite]
+    ulp = ulp_distance(approx, ref)
+    rel_err = relative_error(approx, ref)
+    # take log10 of non-zero errors only, then clip
+    # so that out of range errors land in the end bins
+    log_err = np.log10(rel_err[rel_err > 0])
+    log_err = np.clip(log_err, bin_edges[0], bin_edges[-1])
+    hist = np.histogram(log_err, bins=bin_edges)[0]
+    return {
+        "count": int(approx.size),
+        "nonfinite": int(finite.size - approx.size),
+        "exact": int(np.count_nonzero(ulp == 0)),
+        "max_ulp": int(np.max(ulp)) if ulp.size else 0,
+        "sum_ulp": int(np.sum(ulp, dtype=object)) if ulp.size else 0,
+        "max_rel_error": float(np.max(rel_err)) if rel_err.size else 0.,
+        "approx_exponents": exponent_spread(approx),
+        "ref_exponents": exponent_spread(ref),
+        "bin_edges": bin_edges,
+        "hist": hist,
+    }
+
+
+def combine_summaries(s1, s2):
+    """Merge two error summaries into one.
+
+    Parameters
+    ----------
+    s1 : dict
+        An error summary from error_summary().
+    s2 : dict
+        Another error summary with the same bin_edges.
+
+    Returns
+    -------
+    dict
+        The summary of both sets of values together.
+
+    Raises
+    ------
+    ValueError
+        If the summaries have different bin_edges
+    """
+    if not np.array_equal(s1["bin_edges"], s2["bin_edges"]):
+        raise ValueError("summaries have different bin_edges, "
+                         + "cannot combine histograms")
+    return {
+        "count": s1["count"] + s2["count"],
+        "nonfinite": s1["nonfinite"] + s2["nonfinite"],
+        "exact": s1["exact"] + s2["exact"],
+        "max_ulp": max(s1["max_ulp"], s2["max_ulp"]),
+        "sum_ulp": s1["sum_ulp"] + s2["sum_ulp"],
+        "max_rel_error": max(s1["max_rel_error"], s2["max_rel_error"]),
+        "approx_exponents": tuple(
+            f(a, b) for f, a, b in zip((_combine_min, _combine_max),
+                                       s1["approx_exponents"],
+                                       s2["approx_exponents"])),
+        "ref_exponents": tuple(
+            f(a, b) for f, a, b in zip((_combine_min, _combine_max),
+                                       s1["ref_exponents"],
+                                       s2["ref_exponents"])),
+        "bin_edges": s1["bin_edges"],
+        "hist": s1["hist"] + s2["hist"],
+    }
+
+
+def stream_error_summary(chunks, bin_edges=REL_ERROR_BIN_EDGES):
+    """Summarize the error over a stream of chunks of values.
+
+    Parameters
+    ----------
+    chunks : iterable
+        An iterable of (approx, ref) pairs of array_like values,
+        such as the output of evaluate_chunks().
+    bin_edges : array_like, optional, default=REL_ERROR_BIN_EDGES
+        The histogram bin edges, in powers of 10 of the relative error.
+
+    Returns
+    -------
+    dict
+        The summary of all of the values, see error_summary().
+
+    Notes
+    -----
+    Only one chunk is held in memory at a time,
+    so the total number of values can be much larger than will fit.
+    """
+    result = error_summary([], [], bin_edges=bin_edges)
+    for approx, ref in chunks:
+        result = combine_summaries(
+                result, error_summary(approx, ref, bin_edges=bin_edges))
+    return result
+
+
+def evaluate_chunks(func, ref_func, x, chunk_size=4096):
+    """Evaluate a function and a reference function in chunks.
+
+    Parameters
+    ----------
+    func : callable
+        The approximate function, taking a single float argument,
+        such as topic01_series_approximation.exp().
+    ref_func : callable
+        The reference function, taking an array argument,
+        such as numpy.exp().
+    x : iterable
+        The argument values.
+        This can be a generator so that all values are never in memory.
+    chunk_size : int, optional, default=4096
+        The number of values in each chunk.
+
+    Yields
+    ------
+    numpy.ndarray
+        The approximate values for a chunk.
+    numpy.ndarray
+        The reference values for the same chunk.
+    """
+    chunk = []
+    for xk in x:
+        chunk.append(float(xk))
+        if len(chunk) == chunk_size:
+            xc = np.array(chunk)
+            yield np.array([func(xi) for xi in chunk]), ref_func(xc)
+            chunk = []
+    if chunk:
+        xc = np.array(chunk)
+        yield np.array([func(xi) for xi in chunk]), ref_func(xc)
+
+
+def print_summary(summary):
+    """Print an error summary in a readable format.
+
+    Parameters
+    ----------
+    summary : dict
+        An error summary from error_summary().
+    """
+    count = summary["count"]
+    print(f"count : {count}")
+    print(f"non-finite : {summary['nonfinite']}")
+    print(f"exact : {summary['exact']}")
+    print(f"max ulp : {summary['max_ulp']}")
+    print(f"mean ulp : {summary['sum_ulp'] / count if count else 0.}")
+    print(f"max rel error : {summary['max_rel_error']}")
+    print(f"approx exponents : {summary['approx_exponents']}")
+    print(f"ref exponents : {summary['ref_exponents']}")
+    print("rel error histogram (log10) :")
+    edges = summary["bin_edges"]
+    for lo, hi, n in zip(edges[:-1], edges[1:], summary["hist"]):
+        print(f"  [{lo:5.0f}, {hi:5.0f}) : {n}")
+
+
+def main():
+    from .topic01_series_approximation import exp
+
+    print("\nError in series approximation of exp(x), x in [0, 20]:\n")
+    x = np.linspace(0., 20., 10001)
+    print_summary(stream_error_summary(
+            evaluate_chunks(exp, np.exp, x, chunk_size=1000)))
+
+    print("\nError in series approximation of exp(x), x in [-20, 0]:\n")
+    x = np.linspace(-20., 0., 10001)
+    print_summary(stream_error_summary(
+            evaluate_chunks(exp, np.exp, x, chunk_size=1000)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 """Examples related to number representation in different bases and types."""
 
 
+import math
+
+
 def parse_sign(x):
     """Separate the sign and value of a number.
 
@@ -45,7 +48,9 @@ def max_power_int(x, base=2):
     n = 0
     while x >= base**n:     # >= guarantees the first digit will always be 0
         n += 1
-    return n - 1            # now subtract 1 to avoid the leading 0
+    # now subtract 1 to avoid the leading 0,
+    # but keep at least one digit so that 0 is represented as "0"
+    return max(n - 1, 0)
 
 
 def normalize_float(x, base=2):
@@ -67,6 +72,11 @@ def normalize_float(x, base=2):
         The normalized significand.
     int
         The exponent after normalization.
+
+    Notes
+    -----
+    Does not explicitly check that x is positive and finite.
+    For x == 0 or x == inf, the loops never terminate.
     """
     e = 0
     min_value = 1 / base
@@ -209,16 +219,32 @@ def binary_string_float64(x):
     str
         Binary string representation of the number.
 
+    Raises
+    ------
+    ValueError
+        If x is inf or nan
+
     Notes
     -----
     An attempt is made to cast the input with float().
+    Zero is represented with a zero exponent and significand,
+    keeping the sign bit of -0.0.
     """
     x = float(x)  # attempt to cast to float, so we can assume this later
+    if not math.isfinite(x):
+        raise ValueError(f"x is {x}, should be finite")
     sign, x = parse_sign(x)     # split sign and value of the number
-    x, e = normalize_float(x)   # get significand and exponent
+    if x == 0.:
+        # zero cannot be normalized, and parse_sign() does not see -0.0
+        # as negative, so get its sign bit using copysign()
+        sign = int(math.copysign(1., x) < 0)
+        e = 0
+    else:
+        x, e = normalize_float(x)   # get significand and exponent
     e_sign, e = parse_sign(e)   # split sign and value of exponent
-    # get exponent str, 2**9 is max place value for double precision
-    e_str = digits_to_str_int(digit_list(e, max_pow=9), e_sign)
+    # get exponent str, 2**10 is max place value for double precision
+    # since normalized exponents range from -1073 (subnormals) to 1024
+    e_str = digits_to_str_int(digit_list(e, max_pow=10), e_sign)
     result = digit_list(x, -1, -53)     # get digits of significand
     # convert significand to string representation
     # sign bit, then exponent bits, then significand bits
@@ -14,16 +14,30 @@ def exp(x):
     -------
     float
         The value of the exponential function.
+
+    Notes
+    -----
+    For x < 0, the series has terms of alternating sign
+    that cancel and lose precision, so exp(-x) is calculated instead
+    and the reciprocal is returned.
+    The reciprocal is taken in two steps, as (1 / h) / h with
+    h = exp(-x / 2), so that results in the subnormal range
+    are not flushed to zero by exp(-x) overflowing.
+    Each term is calculated from the previous one
+    as term * x / n, rather than as x**n / n!,
+    so that the intermediate values do not overflow for large x.
     """
+    if x < 0:
+        h = exp(-x / 2)
+        return (1. / h) / h
     eps_a = 1.
     eps_s = 1.e-16
     n = 0
-    result = 0
-    fact_n = 1
+    result = 0.
+    term = 1.
     while eps_a > eps_s:
-        term = x**n / fact_n
         result += term
         n += 1
-        fact_n *= n
         eps_a = abs(term / result)
+        term *= x / n
     return result
@@ -4,7 +4,7 @@ and LU decomposition to solve linear systems.
 
 import numpy as np
 
-from topic02_linalg_module import (
+from .topic02_linalg_module import (
         gauss_solve,
         )
 